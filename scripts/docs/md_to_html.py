@@ -18,10 +18,11 @@ Examples:
 """
 
 import argparse
-import html
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import List, Tuple
 
@@ -32,6 +33,13 @@ except ImportError:
     print("Install it with: pip install mistune>=3.0.0")
     sys.exit(1)
 
+try:
+    import cmarkgfm
+    from cmarkgfm.cmark import Options as CmarkOptions
+    CMARK_AVAILABLE = True
+except ImportError:
+    CMARK_AVAILABLE = False
+
 try:
     from PIL import Image, ImageDraw, ImageFont
     PIL_AVAILABLE = True
@@ -210,7 +218,63 @@ INLINE_STYLES = {
     'blockquote': 'border-left: 4px solid #DADCE0; margin: 1em 0; padding-left: 1em; color: #5f6673; font-size: 12px;',
 }
 
+# Precompiled patterns, built once at import and reused for every file
+# All styled tags are matched in a single pass over the document
+_INLINE_TAG_STYLES = {tag: style for tag, style in INLINE_STYLES.items() if tag not in ('body', 'main')}
+_INLINE_TAG_RE = re.compile(r'<(' + '|'.join(_INLINE_TAG_STYLES) + r')(?!\s+style=)([^>]*)>')
+_PRE_CODE_RE = re.compile(r'<pre style="([^"]*)"[^>]*>\s*<code style="[^"]*"([^>]*)>')
+_HR_RE = re.compile(r'<hr\s*/?>\s*')
+
+# Same replacements as html.escape(), applied in one translate() pass
+_HTML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'})
+_HTML_SPECIALS = frozenset('&<>"\'')
+
+
+# Fixed parts of the output documents, assembled once at import;
+# only the title and body content vary per file
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="fr">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>"""
+
+_STANDARD_BODY_OPEN = f"""</title>
+  <style>
+{STANDARD_CSS}
+  </style>
+</head>
+<body>
+  <main class="doc">
+"""
+
+_GDOCS_BODY_OPEN = f"""</title>
+</head>
+<body style="{INLINE_STYLES['body']}">
+  <main style="{INLINE_STYLES['main']}">
+"""
+
+_HTML_TAIL = """
+  </main>
+</body>
+</html>
+"""
+
+# Template name -> body opening (standard: CSS in <style>, gdocs: inline styles)
+_BODY_OPEN = {
+    'standard': _STANDARD_BODY_OPEN,
+    'gdocs': _GDOCS_BODY_OPEN,
+}
+
+
+def _fast_escape(text: str) -> str:
+    """Escape HTML special characters, returning text unchanged when there are none."""
+    if _HTML_SPECIALS.isdisjoint(text):
+        return text
+    return text.translate(_HTML_ESCAPE_TABLE)
 
+
+@lru_cache(maxsize=1024)
 def format_title(filename: str) -> str:
     """Convert filename to readable title."""
     # Remove extension
@@ -222,24 +286,21 @@ def format_title(filename: str) -> str:
     return title
 
 
+def _inline_style_repl(match: re.Match) -> str:
+    """Build the styled opening tag for an _INLINE_TAG_RE match."""
+    tag = match.group(1)
+    return f'<{tag} style="{_INLINE_TAG_STYLES[tag]}"{match.group(2)}>'
+
+
 def apply_inline_styles(html_content: str) -> str:
     """Apply inline styles to HTML elements for Google Docs compatibility."""
     
-    # Apply styles to common tags
-    for tag, style in INLINE_STYLES.items():
-        if tag in ['body', 'main']:
-            continue
-        # Match opening tags without existing style attribute
-        pattern = f'<{tag}(?!\\s+style=)([^>]*)>'
-        replacement = f'<{tag} style="{style}"\\1>'
-        html_content = re.sub(pattern, replacement, html_content)
+    # Apply styles to common tags (opening tags without existing style attribute)
+    html_content = _INLINE_TAG_RE.sub(_inline_style_repl, html_content)
     
     # Special handling for code inside pre (remove inline styles from code within pre)
-    html_content = re.sub(
-        r'<pre style="([^"]*)"[^>]*>\s*<code style="[^"]*"([^>]*)>',
-        r'<pre style="\1"><code>',
-        html_content
-    )
+    if '<pre ' in html_content:
+        html_content = _PRE_CODE_RE.sub(r'<pre style="\1"><code>', html_content)
     
     return html_content
 
@@ -249,62 +310,38 @@ def create_html_document(title: str, content: str, template: str = 'standard') -
     
     if template == 'gdocs':
         # Google Docs optimized template with inline styles
-        body_style = INLINE_STYLES['body']
-        main_style = INLINE_STYLES['main']
-        
-        # Apply inline styles to content
         content = apply_inline_styles(content)
-        
-        return f"""<!DOCTYPE html>
-<html lang="fr">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>{html.escape(title)}</title>
-</head>
-<body style="{body_style}">
-  <main style="{main_style}">
-{content}
-  </main>
-</body>
-</html>
-"""
-    else:
-        # Standard template with CSS
-        return f"""<!DOCTYPE html>
-<html lang="fr">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>{html.escape(title)}</title>
-  <style>
-{STANDARD_CSS}
-  </style>
-</head>
-<body>
-  <main class="doc">
-{content}
-  </main>
-</body>
-</html>
-"""
+    
+    return ''.join((_HTML_HEAD, _fast_escape(title), _BODY_OPEN[template], content, _HTML_TAIL))
 
 
-def convert_markdown_to_html(md_content: str) -> str:
-    """Convert Markdown content to HTML using mistune."""
-    
-    # Create markdown parser with all extensions
-    markdown = mistune.create_markdown(
+@lru_cache(maxsize=1)
+def _mistune_parser():
+    """Create the mistune parser once and reuse it for every file."""
+    return mistune.create_markdown(
         escape=False,  # We'll handle escaping ourselves
         plugins=['strikethrough', 'footnotes', 'table', 'url', 'task_lists']
     )
+
+
+def convert_markdown_to_html(md_content: str) -> str:
+    """Convert Markdown content to HTML using cmark-gfm if available, mistune otherwise."""
     
-    # Convert to HTML
-    html_content = markdown(md_content)
+    if CMARK_AVAILABLE:
+        # C-backed renderer, same extension set as the mistune plugins below
+        # (UNSAFE keeps raw HTML, like mistune's escape=False)
+        html_content = cmarkgfm.markdown_to_html_with_extensions(
+            md_content,
+            options=CmarkOptions.CMARK_OPT_UNSAFE | CmarkOptions.CMARK_OPT_FOOTNOTES,
+            extensions=['table', 'strikethrough', 'autolink', 'tasklist']
+        )
+    else:
+        html_content = _mistune_parser()(md_content)
     
     # Remove horizontal rules (<hr> tags) that come from --- in Markdown
     # These are often used as section separators in Markdown but not wanted in final HTML
-    html_content = re.sub(r'<hr\s*/?>\s*', '', html_content)
+    if '<hr' in html_content:
+        html_content = _HR_RE.sub('', html_content)
     
     return html_content
 
@@ -315,9 +352,9 @@ def process_markdown_file(input_path: Path, template: str = 'both') -> List[Tupl
     results = []
     
     try:
-        # Read Markdown content
-        with open(input_path, 'r', encoding='utf-8') as f:
-            md_content = f.read()
+        # Read Markdown content in one binary read and a single decode
+        # (both parsers normalize CRLF line endings themselves)
+        md_content = input_path.read_bytes().decode('utf-8')
         
         # Convert to HTML
         html_body = convert_markdown_to_html(md_content)
@@ -453,11 +490,12 @@ Examples:
         print(f"Found {len(md_files)} Markdown file(s)")
         print()
         
-        for md_file in md_files:
-            print(f"Converting: {md_file}")
-            results = process_markdown_file(md_file, args.template)
-            all_results.extend(results)
-            print()
+        # Files are independent and parsing is CPU-bound: convert them in parallel
+        convert = partial(process_markdown_file, template=args.template)
+        with ProcessPoolExecutor() as executor:
+            for results in executor.map(convert, md_files):
+                all_results.extend(results)
+        print()
     
     # Summary
     successful = sum(1 for _, success in all_results if success)